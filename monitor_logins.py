@@ -1,7 +1,18 @@
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import sys
+import zipfile
+
+try:
+    # multithreaded CSV reader, used when available
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa_csv = None
 
 
 STD_DEV_THRESHOLD = 3.0
@@ -9,197 +20,451 @@ CONSECUTIVE_MINUTES_THRESHOLD = 10
 BASELINE_ZERO_THRESHOLD = 200 # at least this many logins normally for zero to be alarming
 # small number to treat standard deviation as effectively zero
 STD_DEV_EPSILON = 1e-6
+# baseline statistics are cached next to this script between runs
+BASELINE_CACHE_DIR = Path(__file__).resolve().parent / '.cache'
+# part of every cache key, bump it when the baseline statistics are computed differently
+BASELINE_CACHE_VERSION = 1
+# measured files larger than this are streamed in chunks of CHUNK_SIZE rows
+STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
+CHUNK_SIZE = 262144
+MINUTES_PER_WEEK = 7 * 24 * 60
+# minute of the week the unix epoch fell on (a Thursday), minute counts since the epoch are shifted by it
+_EPOCH_MINUTE_OF_WEEK = pd.Timestamp(0).dayofweek * 24 * 60
+# anomaly_type labels, indexed by the codes from _classify_anomalies
+ANOMALY_TYPES = ['Normal', 'Zero', 'Low', 'High']
+
+# alert messages, filled with format_map and written in one go
+_ALERT_STARTED_TEMPLATE = (
+    "--- ALERT STARTED ---\n"
+    "Detected at Time: {current_timestamp}\n"
+    "Estimated Start:  {alert_start_timestamp} (Issue lasting >= {consecutive_minutes} mins)\n"
+    "Initial Reason:   Anomaly Type '{initial_anomaly_type}'\n"
+    "  Initial Value:  {initial_value:.2f} at {alert_start_timestamp}\n"
+    "  Current Value:  {current_value:.2f} at {current_timestamp}\n"
+    "  Baseline Mean:  {mean:.2f} (this minute)\n"
+    "  Expected Range: [{lower_bound:.2f} - {upper_bound:.2f}] (if std > {std_dev_epsilon})\n"
+    + "-" * 20 + "\n"
+)
+_ALERT_RESOLVED_TEMPLATE = (
+    "--- ALERT RESOLVED ---\n"
+    "Detected at Time: {current_timestamp}\n"
+    "Estimated Resolve: {resolve_time_estimate} (Normal >= {consecutive_minutes} mins)\n"
+    "Original Alert Start: {alert_start_timestamp} (Reason: '{initial_anomaly_type}')\n"
+    "  Current Value: {current_value:.2f}\n"
+    "  Baseline Mean: {mean:.2f}\n"
+    + "-" * 20 + "\n"
+)
+
+
+def _minute_of_week(index: pd.DatetimeIndex) -> np.ndarray:
+    # minute of the week (Monday 00:00 = 0) for every timestamp, in local wall time
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    # asi8 is a view on the int64 ticks, in whatever unit the index was parsed with
+    ticks_per_minute = np.timedelta64(1, 'm') // np.timedelta64(1, index.unit)
+    minutes = index.asi8 // ticks_per_minute
+    minute_of_week = ((minutes + _EPOCH_MINUTE_OF_WEEK) % MINUTES_PER_WEEK).astype(np.int32)
+    # NaT rows get their own slot past the end of the week, which never has baseline data
+    if index.hasnans:
+        minute_of_week[index.isna()] = MINUTES_PER_WEEK
+    return minute_of_week
+
+
+def _classify_anomalies(values: np.ndarray, means: np.ndarray, stds: np.ndarray,
+                        lower_bounds: np.ndarray, upper_bounds: np.ndarray) -> np.ndarray:
+    # anomaly type per row as an index into ANOMALY_TYPES, written in one
+    # int8 array with lower priority types first so later ones overwrite them
+    codes = np.zeros(len(values), dtype=np.int8)
+    # every comparison is written into this one buffer instead of a new temporary
+    mask = np.empty(len(values), dtype=bool)
+
+    # deviation anomaly: value significantly deviates, but ONLY if std is not effectively zero
+    std_usable = stds > STD_DEV_EPSILON
+    np.greater(values, upper_bounds, out=mask)
+    mask &= std_usable
+    np.copyto(codes, 3, where=mask)
+    np.less(values, lower_bounds, out=mask)
+    mask &= std_usable
+    np.copyto(codes, 2, where=mask)
+
+    # zero anomaly: measured value is zero when baseline expects activity, nr 1 priority
+    np.greater_equal(means, BASELINE_ZERO_THRESHOLD, out=mask)
+    mask &= values == 0
+    np.copyto(codes, 1, where=mask)
+    return codes
+
+
+def _prepare_frame(df: pd.DataFrame, filepath: Path, log: Callable[[str], None] = print) -> pd.DataFrame | None:
+    # validates the raw CSV columns and indexes them by time, messages go to log
+    if df.shape[1] != 2:
+         log(f"Error: CSV file {filepath} should have 2 columns (time, measurement_value). Found {df.shape[1]}.")
+         return None
+    df.columns = ['time', 'measurement_value']
+    # login counts fit easily in float32, halving the bytes every later step moves.
+    # fractional values and baseline means then carry ~7 significant digits, so a
+    # printed .2f value can differ from a float64 run in the last digit
+    measurement_value = pd.to_numeric(df['measurement_value'], errors='coerce', downcast='float')
+
+    if np.isnan(measurement_value.to_numpy()).any():
+        log(f"Warning: Non-numeric values found in {filepath}, replacing with 0.")
+        measurement_value = measurement_value.fillna(0)
+    df['measurement_value'] = measurement_value
 
-
-def load_and_prepare_data(filepath: Path) -> pd.DataFrame | None:
+    try:
+        df['time'] = pd.to_datetime(df['time'])
+    except ValueError as e:
+        log(f"Error: Could not parse the time column of {filepath}: {e}")
+        return None
+    df.set_index('time', inplace=True)
+    # log files are normally written in order already, skip the sort then
+    if not df.index.is_monotonic_increasing:
+        df.sort_index(inplace=True, kind='mergesort')
+    return df
+
+def _read_csv(filepath: Path) -> pd.DataFrame:
+    if pa_csv is None:
+        return pd.read_csv(filepath)
+    # the time column is kept as text: pyarrow would convert UTC offsets to UTC and
+    # lose the wall time, pd.to_datetime in _prepare_frame keeps it like the C engine path
+    header = pd.read_csv(filepath, nrows=0).columns
+    convert_options = pa_csv.ConvertOptions(column_types={header[0]: pa.string()}, strings_can_be_null=True)
+    return pa_csv.read_csv(filepath, convert_options=convert_options).to_pandas()
+
+def load_and_prepare_data(filepath: Path, log: Callable[[str], None] = print) -> pd.DataFrame | None:
     if not filepath.exists():
-        print(f"Error: File not found at {filepath}")
+        log(f"Error: File not found at {filepath}")
         return None
     try:
-        df = pd.read_csv(filepath)
-        if df.shape[1] != 2:
-             print(f"Error: CSV file {filepath} should have 2 columns (time, measurement_value). Found {df.shape[1]}.")
-             return None
-        df.columns = ['time', 'measurement_value']
-        df['measurement_value'] = pd.to_numeric(df['measurement_value'], errors='coerce')
-
-        if df['measurement_value'].isnull().any():
-            print(f"Warning: Non-numeric values found in {filepath}, replacing with 0.")
-            df['measurement_value'].fillna(0, inplace=True)
+        df = _read_csv(filepath)
+    except (OSError, ValueError) as e:
+        log(f"Error loading data from {filepath}: {e}")
+        return None
 
-        df['time'] = pd.to_datetime(df['time'])
-        df.set_index('time', inplace=True)
-        df.sort_index(inplace=True)
-        print(f"Successfully loaded and prepared data from {filepath}")
-        return df
-    except Exception as e:
-        print(f"Error loading or preparing data from {filepath}: {e}")
+    df = _prepare_frame(df, filepath, log)
+    if df is None:
         return None
+    log(f"Successfully loaded and prepared data from {filepath}")
+    return df
+
+def iter_prepared_chunks(filepath: Path, chunksize: int = CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    # like load_and_prepare_data, but yields the file in chunks so only one is held in memory.
+    # the file has to be in chronological order, rows are only sorted within a chunk
+    if not filepath.exists():
+        print(f"Error: File not found at {filepath}")
+        return
+    try:
+        # pyarrow cannot read in chunks, this always uses the C engine
+        reader = pd.read_csv(filepath, chunksize=chunksize)
+    except (OSError, ValueError) as e:
+        print(f"Error loading data from {filepath}: {e}")
+        return
+
+    last_timestamp = None
+    with reader:
+        while True:
+            try:
+                chunk = next(reader)
+            except StopIteration:
+                return
+            except (OSError, ValueError) as e:
+                print(f"Error loading data from {filepath}: {e}")
+                return
+
+            df = _prepare_frame(chunk, filepath)
+            if df is None:
+                return
+            if last_timestamp is not None and df.index[0] < last_timestamp:
+                print(f"Warning: {filepath} is not in chronological order, alerts around {df.index[0]} may be inaccurate.")
+            last_timestamp = df.index[-1]
+            yield df
 
 def calculate_baseline_stats(baseline_df: pd.DataFrame) -> pd.DataFrame | None:
     if baseline_df is None:
         return None
+    minute_of_week = _minute_of_week(baseline_df.index).astype(np.intp)
+    values = baseline_df['measurement_value'].to_numpy(np.float64)
+    # rows without a timestamp do not belong to any minute of the week
+    known_time = minute_of_week < MINUTES_PER_WEEK
+    if not known_time.all():
+        minute_of_week = minute_of_week[known_time]
+        values = values[known_time]
+
+    # per-minute sums via bincount, deviations are summed in a second pass
+    # around the mean to keep the std numerically stable
+    counts = np.bincount(minute_of_week, minlength=MINUTES_PER_WEEK)
+    sums = np.bincount(minute_of_week, weights=values, minlength=MINUTES_PER_WEEK)
+    present = np.flatnonzero(counts)
+    means = np.zeros(MINUTES_PER_WEEK)
+    means[present] = sums[present] / counts[present]
+    deviations = values - means.take(minute_of_week)
+    squares = np.bincount(minute_of_week, weights=deviations * deviations, minlength=MINUTES_PER_WEEK)
+    # sample std (ddof=1), minutes with a single sample keep a std of 0
+    stds = np.zeros(MINUTES_PER_WEEK)
+    np.divide(squares, counts - 1, out=stds, where=counts > 1)
+    np.sqrt(stds, out=stds)
+
+    # accumulated in float64 for precision, stored as float32 like the measurements
+    # (see _prepare_frame for the effect on printed values)
+    baseline_stats = pd.DataFrame(
+        {'mean': means[present].astype(np.float32), 'std': stds[present].astype(np.float32)},
+        index=pd.Index(present, name='minute_of_week')
+    )
+    print("Calculated baseline statistics (mean, std dev) per minute-of-the-week.")
+    return baseline_stats
+
+def _baseline_cache_prefix(filepath: Path) -> str:
+    # all cache entries of one baseline file share this prefix
+    return hashlib.sha1(str(filepath.resolve()).encode()).hexdigest()[:16]
+
+def _baseline_cache_path(filepath: Path) -> Path:
+    # cache entries are keyed by the baseline file path, size and modification time and the cache version
+    stat = filepath.stat()
+    key = f"{BASELINE_CACHE_VERSION}:{stat.st_size}:{stat.st_mtime_ns}"
+    return BASELINE_CACHE_DIR / f"{_baseline_cache_prefix(filepath)}-{hashlib.sha1(key.encode()).hexdigest()[:16]}.npz"
+
+def load_cached_baseline_stats(filepath: Path) -> pd.DataFrame | None:
+    if not filepath.exists():
+        return None
+    cache_path = _baseline_cache_path(filepath)
+    if not cache_path.exists():
+        return None
     try:
-        df_copy = baseline_df.copy()
-        df_copy['minute_of_week'] = (
-            df_copy.index.dayofweek * 24 * 60 +
-            df_copy.index.hour * 60 +
-            df_copy.index.minute
-        )
-        baseline_stats = df_copy.groupby('minute_of_week')['measurement_value'].agg(['mean', 'std'])
-        baseline_stats['std'] = baseline_stats['std'].fillna(0)
-        print("Calculated baseline statistics (mean, std dev) per minute-of-the-week.")
+        with np.load(cache_path) as cached:
+            baseline_stats = pd.DataFrame(
+                {'mean': cached['mean'], 'std': cached['std']},
+                index=pd.Index(cached['minute_of_week'], name='minute_of_week')
+            )
+        print(f"\nLoaded cached baseline statistics for {filepath}")
         return baseline_stats
-    except Exception as e:
-        print(f"Error calculating baseline statistics: {e}")
+    # a missing, truncated or corrupt cache file only means recomputing the baseline
+    except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as e:
+        print(f"Warning: Could not read baseline cache {cache_path}: {e}")
         return None
 
+def save_baseline_stats_cache(filepath: Path, baseline_stats: pd.DataFrame):
+    try:
+        BASELINE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path = _baseline_cache_path(filepath)
+        # entries for older versions of this baseline file can never be hit again
+        for stale_path in BASELINE_CACHE_DIR.glob(f"{_baseline_cache_prefix(filepath)}-*.npz"):
+            if stale_path != cache_path:
+                stale_path.unlink()
+        np.savez(
+            cache_path,
+            minute_of_week=baseline_stats.index.to_numpy(),
+            mean=baseline_stats['mean'].to_numpy(),
+            std=baseline_stats['std'].to_numpy()
+        )
+    except OSError as e:
+        print(f"Warning: Could not write baseline cache for {filepath}: {e}")
+
+def _baseline_lookup_tables(baseline_stats: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    # baseline mean and std indexed by minute of the week, minutes missing from
+    # the baseline fall back to 0, as does the extra NaT slot at the end
+    mean_lut = np.zeros(MINUTES_PER_WEEK + 1, dtype=np.float32)
+    std_lut = np.zeros(MINUTES_PER_WEEK + 1, dtype=np.float32)
+    mean_lut[baseline_stats.index.values] = baseline_stats['mean'].fillna(0).to_numpy()
+    std_lut[baseline_stats.index.values] = baseline_stats['std'].fillna(0).to_numpy()
+    return mean_lut, std_lut
+
+def _find_anomalies(measured_df: pd.DataFrame, mean_lut: np.ndarray, std_lut: np.ndarray) -> pd.DataFrame:
+    # all the work happens on plain arrays, the result frame is assembled once at the end
+    values = measured_df['measurement_value'].to_numpy(copy=False)
+    minute_of_week = _minute_of_week(measured_df.index)
+
+    means = mean_lut.take(minute_of_week)
+    stds = std_lut.take(minute_of_week)
+    upper_bounds = means + STD_DEV_THRESHOLD * stds
+    lower_bounds = np.maximum(0, means - STD_DEV_THRESHOLD * stds)
+
+    codes = _classify_anomalies(values, means, stds, lower_bounds, upper_bounds)
+
+    # ensures the index is named 'time' if it got lost
+    index = measured_df.index
+    if index.name != 'time':
+         index = index.rename('time')
+
+    return pd.DataFrame(
+        {
+            # values is a read-only view of measured_df under copy-on-write, the result gets its own copy
+            'measurement_value': values.copy(),
+            'minute_of_week': minute_of_week,
+            'mean': means,
+            'std': stds,
+            'upper_bound': upper_bounds,
+            'lower_bound': lower_bounds,
+            'is_anomaly': codes != 0,
+            'anomaly_type': pd.Categorical.from_codes(codes, categories=ANOMALY_TYPES),
+        },
+        index=index,
+        copy=False
+    )
+
 def detect_anomalies(measured_df: pd.DataFrame, baseline_stats: pd.DataFrame) -> pd.DataFrame | None:
     # detects anomalies by comparing measured data to baseline data.
     if measured_df is None or baseline_stats is None:
         return None
+    # baseline_stats may come from the cache, so only building the lookup tables can fail on bad input
     try:
-        df_copy = measured_df.copy()
-        df_copy['minute_of_week'] = (
-            df_copy.index.dayofweek * 24 * 60 +
-            df_copy.index.hour * 60 +
-            df_copy.index.minute
-        )
-
-        # ensures the index is named 'time' before merging if it got lost
-        if df_copy.index.name != 'time':
-             df_copy.index.name = 'time'
-
-
-        merged_df = pd.merge(
-            df_copy,
-            baseline_stats,
-            left_on='minute_of_week',
-            right_index=True, # merges on the index of baseline_stats
-            how='left',
-            suffixes=('', '_baseline')
-        )
-
-
-        merged_df['mean'] = merged_df['mean'].fillna(0)
-        merged_df['std'] = merged_df['std'].fillna(0)
-
-        merged_df['upper_bound'] = merged_df['mean'] + STD_DEV_THRESHOLD * merged_df['std']
-        merged_df['lower_bound'] = np.maximum(0, merged_df['mean'] - STD_DEV_THRESHOLD * merged_df['std'])
-
-
-        # deviation anomaly: Value significantly deviates, but ONLY if std is not effectively zero
-        deviation_anomaly = (
-            ((merged_df['measurement_value'] < merged_df['lower_bound']) | \
-             (merged_df['measurement_value'] > merged_df['upper_bound'])) & \
-            (merged_df['std'] > STD_DEV_EPSILON) # Check against small epsilon
-        )
-
-        #  zero anomaly: Measured value is zero when baseline expects activity
-        zero_anomaly = (merged_df['measurement_value'] == 0) & \
-                       (merged_df['mean'] >= BASELINE_ZERO_THRESHOLD)
-
-
-        merged_df['is_anomaly'] = deviation_anomaly | zero_anomaly
-
-
-        merged_df['anomaly_type'] = 'Normal' # default value
-        # zero anomaly is nr 1 priority
-        merged_df.loc[zero_anomaly, 'anomaly_type'] = 'Zero'
-        # deviation anomalies come second
-        merged_df.loc[deviation_anomaly & (merged_df['anomaly_type'] == 'Normal') & (merged_df['measurement_value'] < merged_df['lower_bound']), 'anomaly_type'] = 'Low'
-        merged_df.loc[deviation_anomaly & (merged_df['anomaly_type'] == 'Normal') & (merged_df['measurement_value'] > merged_df['upper_bound']), 'anomaly_type'] = 'High'
+        mean_lut, std_lut = _baseline_lookup_tables(baseline_stats)
+    except (KeyError, IndexError, ValueError) as e:
+        print(f"Error detecting anomalies: {e}")
+        return None
 
+    merged_df = _find_anomalies(measured_df, mean_lut, std_lut)
 
-        print("Anomaly detection complete.")
-        if not isinstance(merged_df.index, pd.DatetimeIndex):
-             print("Warning: Index might have been lost during processing.")
-        return merged_df
+    print("Anomaly detection complete.")
+    if not isinstance(merged_df.index, pd.DatetimeIndex):
+         print("Warning: Index might have been lost during processing.")
+    return merged_df
 
-    except Exception as e:
+def detect_anomalies_in_chunks(filepath: Path, baseline_stats: pd.DataFrame) -> Iterator[pd.DataFrame]:
+    # streaming detect_anomalies: reads the measured file chunk by chunk and yields the anomaly data of each
+    try:
+        mean_lut, std_lut = _baseline_lookup_tables(baseline_stats)
+    except (KeyError, IndexError, ValueError) as e:
         print(f"Error detecting anomalies: {e}")
-        return None
+        return
+    for measured_df in iter_prepared_chunks(filepath, chunksize=CHUNK_SIZE):
+        yield _find_anomalies(measured_df, mean_lut, std_lut)
+
+
+def _new_monitor_state() -> dict:
+    # alert state plus the run of equal is_anomaly flags still open at the end of the last chunk
+    return {
+        'alert_active': False,
+        'alert_start_timestamp': None,
+        'initial_anomaly_type': None,
+        'run_is_anomaly': None,
+        'run_length': 0,
+        'run_start_row': None,
+        'anomalies_seen': False,
+    }
+
+def _monitor_chunk(anomalies_df: pd.DataFrame, state: dict):
+    # run-length encode the anomaly flags: every run of identical flags is
+    # described by its start position, length and flag value
+    flags = anomalies_df['is_anomaly'].to_numpy(dtype=bool)
+    if len(flags) == 0:
+        return
 
+    # healthy chunk without an active alert (the common case): nothing can
+    # start or resolve, only the open normal run grows
+    if not flags.any():
+        if not state['alert_active']:
+            if state['run_is_anomaly'] is None or state['run_is_anomaly']:
+                state['run_start_row'] = anomalies_df.iloc[0]
+                state['run_length'] = 0
+            state['run_is_anomaly'] = False
+            state['run_length'] += len(flags)
+            return
+    else:
+        state['anomalies_seen'] = True
+
+    run_bounds = np.flatnonzero(np.diff(flags.astype(np.int8))) + 1
+    run_starts = np.concatenate(([0], run_bounds))
+    run_lengths = np.diff(np.concatenate((run_starts, [len(flags)])))
+
+    # the first run continues the run left open by the previous chunk if the flags match
+    carried = state['run_length'] if flags[0] == state['run_is_anomaly'] else 0
+    streaks = run_lengths.copy()
+    streaks[0] += carried
+
+    # positions come straight from the runs, no index lookups needed
+    timestamps = anomalies_df.index
+    rows = anomalies_df.iloc
+
+    # only runs whose streak reaches the threshold inside this chunk can start or resolve an alert
+    crossing_runs = np.flatnonzero(
+        (streaks >= CONSECUTIVE_MINUTES_THRESHOLD) &
+        (streaks - run_lengths < CONSECUTIVE_MINUTES_THRESHOLD)
+    )
+    for run in crossing_runs:
+        start_pos = run_starts[run]
+        is_anomaly_run = flags[start_pos]
+        if is_anomaly_run == state['alert_active']:
+            continue
+
+        # the streak reaches the threshold on this row
+        earlier_length = streaks[run] - run_lengths[run]
+        current_pos = start_pos + CONSECUTIVE_MINUTES_THRESHOLD - 1 - earlier_length
+        current_timestamp = timestamps[current_pos]
+        current_row_data = rows[current_pos]
+        first_row_data = state['run_start_row'] if earlier_length else rows[start_pos]
+
+        if is_anomaly_run:
+            alert_start_timestamp = first_row_data.name
+            initial_anomaly_type = first_row_data['anomaly_type']
+
+            # one write per alert instead of a print per line
+            sys.stdout.write(_ALERT_STARTED_TEMPLATE.format_map({
+                'current_timestamp': current_timestamp,
+                'alert_start_timestamp': alert_start_timestamp,
+                'consecutive_minutes': CONSECUTIVE_MINUTES_THRESHOLD,
+                'initial_anomaly_type': initial_anomaly_type,
+                'initial_value': first_row_data['measurement_value'],
+                'current_value': current_row_data['measurement_value'],
+                'mean': current_row_data['mean'],
+                'lower_bound': current_row_data['lower_bound'],
+                'upper_bound': current_row_data['upper_bound'],
+                'std_dev_epsilon': STD_DEV_EPSILON,
+            }))
+            state['alert_active'] = True
+            state['alert_start_timestamp'] = alert_start_timestamp
+            state['initial_anomaly_type'] = initial_anomaly_type
+
+        else: # normal again
+            resolve_time_estimate = first_row_data.name
+
+            sys.stdout.write(_ALERT_RESOLVED_TEMPLATE.format_map({
+                'current_timestamp': current_timestamp,
+                'resolve_time_estimate': resolve_time_estimate,
+                'consecutive_minutes': CONSECUTIVE_MINUTES_THRESHOLD,
+                'alert_start_timestamp': state['alert_start_timestamp'],
+                'initial_anomaly_type': state['initial_anomaly_type'],
+                'current_value': current_row_data['measurement_value'],
+                'mean': current_row_data['mean'],
+            }))
+            state['alert_active'] = False
+            state['alert_start_timestamp'] = None
+            state['initial_anomaly_type'] = None
+
+    # keep the last run open for the next chunk
+    if len(run_starts) > 1 or not carried:
+        state['run_start_row'] = rows[run_starts[-1]]
+    state['run_is_anomaly'] = bool(flags[-1])
+    state['run_length'] = int(streaks[-1])
 
 def monitor_and_alert(anomalies_df: pd.DataFrame):
-
-    if anomalies_df is None or not isinstance(anomalies_df.index, pd.DatetimeIndex):
+    monitor_and_alert_chunks([anomalies_df])
+
+def monitor_and_alert_chunks(anomaly_chunks: Iterable[pd.DataFrame]):
+    # monitors anomaly data arriving in chronological chunks, streaks carry over between chunks
+    state = None
+    for anomalies_df in anomaly_chunks:
+        if anomalies_df is None or not isinstance(anomalies_df.index, pd.DatetimeIndex):
+            break
+
+        if state is None:
+            sys.stdout.write(
+                f"\n--- Monitoring Started ---\n"
+                f"Alerting on issues lasting >= {CONSECUTIVE_MINUTES_THRESHOLD} minutes.\n"
+                f"Deviation threshold: {STD_DEV_THRESHOLD} std deviations from baseline mean (ignored if baseline std < {STD_DEV_EPSILON}).\n"
+                f"Zero threshold: Alerts if logins drop to 0 when baseline mean is >= {BASELINE_ZERO_THRESHOLD}.\n\n"
+            )
+            state = _new_monitor_state()
+
+        _monitor_chunk(anomalies_df, state)
+
+    if state is None:
         print("Cannot monitor: Anomaly data is missing or index is not a DatetimeIndex.")
         return
 
-    print(f"\n--- Monitoring Started ---")
-    print(f"Alerting on issues lasting >= {CONSECUTIVE_MINUTES_THRESHOLD} minutes.")
-    print(f"Deviation threshold: {STD_DEV_THRESHOLD} std deviations from baseline mean (ignored if baseline std < {STD_DEV_EPSILON}).")
-    print(f"Zero threshold: Alerts if logins drop to 0 when baseline mean is >= {BASELINE_ZERO_THRESHOLD}.\n")
-
-    alert_active = False
-    anomaly_streak = 0
-    normal_streak = 0
-    alert_start_timestamp = None
-    initial_anomaly_type = None
-
-    for row_tuple in anomalies_df.itertuples():
-        current_timestamp = row_tuple.Index
-        is_anomaly_now = row_tuple.is_anomaly
-        current_anomaly_type = row_tuple.anomaly_type
-
-        if is_anomaly_now:
-            anomaly_streak += 1
-            normal_streak = 0
-            if anomaly_streak >= CONSECUTIVE_MINUTES_THRESHOLD and not alert_active:
-                try:
-                    current_pos = anomalies_df.index.get_loc(current_timestamp)
-                    start_pos = max(0, current_pos - (CONSECUTIVE_MINUTES_THRESHOLD - 1))
-                    alert_start_timestamp = anomalies_df.index[start_pos]
-                    first_anomaly_row_data = anomalies_df.iloc[start_pos]
-                    initial_anomaly_type = first_anomaly_row_data['anomaly_type']
-
-                    print(f"--- ALERT STARTED ---")
-                    print(f"Detected at Time: {current_timestamp}")
-                    print(f"Estimated Start:  {alert_start_timestamp} (Issue lasting >= {CONSECUTIVE_MINUTES_THRESHOLD} mins)")
-                    print(f"Initial Reason:   Anomaly Type '{initial_anomaly_type}'")
-                    print(f"  Initial Value:  {first_anomaly_row_data['measurement_value']:.2f} at {alert_start_timestamp}")
-                    print(f"  Current Value:  {row_tuple.measurement_value:.2f} at {current_timestamp}")
-                    print(f"  Baseline Mean:  {row_tuple.mean:.2f} (this minute)")
-                    print(f"  Expected Range: [{row_tuple.lower_bound:.2f} - {row_tuple.upper_bound:.2f}] (if std > {STD_DEV_EPSILON})")
-                    print("-" * 20)
-                    alert_active = True
-
-                except Exception as e:
-                     print(f"Error during alert start logic at {current_timestamp}: {e}")
-                     alert_active = False
-                     alert_start_timestamp = None
-                     initial_anomaly_type = None
-
-        else: # not an anomaly
-            normal_streak += 1
-            if anomaly_streak > 0:
-                anomaly_streak = 0
-            if normal_streak >= CONSECUTIVE_MINUTES_THRESHOLD and alert_active:
-                try:
-                    current_pos = anomalies_df.index.get_loc(current_timestamp)
-                    resolve_pos = max(0, current_pos - (CONSECUTIVE_MINUTES_THRESHOLD - 1))
-                    resolve_time_estimate = anomalies_df.index[resolve_pos]
-
-                    print(f"--- ALERT RESOLVED ---")
-                    print(f"Detected at Time: {current_timestamp}")
-                    print(f"Estimated Resolve: {resolve_time_estimate} (Normal >= {CONSECUTIVE_MINUTES_THRESHOLD} mins)")
-                    print(f"Original Alert Start: {alert_start_timestamp} (Reason: '{initial_anomaly_type}')")
-                    print(f"  Current Value: {row_tuple.measurement_value:.2f}")
-                    print(f"  Baseline Mean: {row_tuple.mean:.2f}")
-                    print("-" * 20)
-                    alert_active = False
-                    alert_start_timestamp = None
-                    initial_anomaly_type = None
-                except Exception as e:
-                    print(f"Error during alert resolve logic at {current_timestamp}: {e}")
-                    alert_active = False
-                    alert_start_timestamp = None
-                    initial_anomaly_type = None
-
+    if not state['anomalies_seen']:
+        print("No anomalies detected.")
     print("\n--- Monitoring Finished ---")
-    if alert_active:
-        print(f"Warning: Monitoring finished while an alert starting around {alert_start_timestamp} (Reason: '{initial_anomaly_type}') was still active.")
+    if state['alert_active']:
+        print(f"Warning: Monitoring finished while an alert starting around {state['alert_start_timestamp']} (Reason: '{state['initial_anomaly_type']}') was still active.")
 
 
 def main():
@@ -210,17 +475,43 @@ def main():
     baseline_file = Path(baseline_path_str.strip())
     measured_file = Path(measured_path_str.strip())
 
-    print("\nLoading baseline data...")
-    baseline_df = load_and_prepare_data(baseline_file)
-    if baseline_df is None: return
-
-    print("\nCalculating baseline statistics...")
-    baseline_stats = calculate_baseline_stats(baseline_df)
-    if baseline_stats is None: return
-
-    print("\nLoading measured data...")
-    measured_df = load_and_prepare_data(measured_file)
-    if measured_df is None: return
+    baseline_stats = load_cached_baseline_stats(baseline_file)
+    # very large measured files are streamed instead of loaded at once to bound memory use
+    stream_measured = measured_file.exists() and measured_file.stat().st_size > STREAMING_THRESHOLD_BYTES
+
+    # the CSV parsing happens in C and releases the GIL, so both files are loaded concurrently.
+    # the workers only collect their messages, they are printed from here in a fixed order
+    baseline_log = []
+    measured_log = []
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if baseline_stats is None:
+            baseline_future = executor.submit(load_and_prepare_data, baseline_file, baseline_log.append)
+        if not stream_measured:
+            measured_future = executor.submit(load_and_prepare_data, measured_file, measured_log.append)
+
+        if baseline_stats is None:
+            print("\nLoading baseline data...")
+            baseline_df = baseline_future.result()
+            for message in baseline_log:
+                print(message)
+            if baseline_df is None: return
+
+            print("\nCalculating baseline statistics...")
+            baseline_stats = calculate_baseline_stats(baseline_df)
+            if baseline_stats is None: return
+            save_baseline_stats_cache(baseline_file, baseline_stats)
+
+        if not stream_measured:
+            print("\nLoading measured data...")
+            measured_df = measured_future.result()
+            for message in measured_log:
+                print(message)
+            if measured_df is None: return
+
+    if stream_measured:
+        print(f"\nStreaming measured data in chunks of {CHUNK_SIZE} rows...")
+        monitor_and_alert_chunks(detect_anomalies_in_chunks(measured_file, baseline_stats))
+        return
 
     print("\nDetecting anomalies...")
     anomalies_df = detect_anomalies(measured_df, baseline_stats)